@@ -1 +1,3 @@
-from swimrankingsscraper.swimrankingsscraper import SwimrankingsScraper  # noqa: F401
\ No newline at end of file
+from swimrankingsscraper.swimrankingsscraper import SwimrankingsScraper  # noqa: F401
+from swimrankingsscraper.swimrankingsscraper import SessionManager  # noqa: F401
+from swimrankingsscraper.swimrankingsscraper import AsyncSessionManager  # noqa: F401
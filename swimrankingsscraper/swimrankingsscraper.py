@@ -4,7 +4,7 @@ SwimrankingsScraper: A web scraper for Swimrankings.net to retrieve information
 Dependencies:
 - requests
 - BeautifulSoup (bs4)
-- urllib.parse
+- httpx (optional, for the asynchronous API)
 
 Usage:
 1. Create an instance of SwimrankingsScraper.
@@ -22,6 +22,7 @@ Example:
 Classes:
 - SwimrankingsScraper: Main class for the Swimrankings web scraper.
 - SessionManager: Manages the HTTP session and enforces request rate limits.
+- AsyncSessionManager: Manages an asynchronous HTTP/2 client and enforces request rate limits.
 - ScraperMixin: A mixin class providing common functionality for other scraper classes.
 - Athlete: Represents an athlete and provides methods to retrieve personal bests and meet information.
 - Meet: Represents a swimming meet and provides methods to retrieve information about clubs, events, and results.
@@ -36,97 +37,193 @@ Attributes:
 - BASE_URL: The base URL for the Swimrankings website.
 
 Usage Notes:
-- Ensure that the required dependencies (requests, BeautifulSoup, urllib) are installed.
+- Ensure that the required dependencies (requests, BeautifulSoup) are installed.
 - The provided example demonstrates how to use the scraper to retrieve information about athletes and their Individual Medley coefficients.
 
 """
 
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, parse_qs
-from datetime import datetime
-import unicodedata
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from unicodedata import normalize
+from sys import intern
 import time
 import re
+import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from functools import lru_cache
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for the asynchronous API
+    httpx = None
 
 BASE_URL = 'https://www.swimrankings.net/index.php?'
 
+# Resolve the lxml tree builder once instead of on every parse
+_LXML_BUILDER = builder_registry.lookup('lxml')
+
+# Pages whose list_* methods only read a known subtree are parsed down to that subtree
+_PAGE_STRAINERS = {
+    'rankingDetail': SoupStrainer('table', {'class': 'athleteList'}),
+}
+
+# Number of recently requested pages each scraper instance keeps
+_PAGE_CACHE_SIZE = 4
+
+# Precompiled patterns for pulling values out of links and tooltips
+_SPLIT_TIME_RE = re.compile(r"<td class=\\'split1\\'>(.*?)<\/td>")
+_RESULT_ID_RE = re.compile(r'[?&]id=([^&]+)')
+_ATHLETE_ID_RE = re.compile(r'[?&]athleteId=([^&]+)')
+_MEET_ID_RE = re.compile(r'[?&]meetId=([^&]+)')
+_CLUB_ID_RE = re.compile(r'[?&]clubId=([^&]+)')
+
+# Pages that do not change once published are kept longer in the on-disk cache
+_CACHE_URLS_EXPIRE_AFTER = {re.compile(r'[?&]page=resultDetail(&|$)'): 86400}
+
+# athleteGender values of the club ranking page, indexed by the gender argument of Club.list_athletes
+_ATHLETE_GENDERS = ('CURRENT', 'ALL_MEN', 'ALL_WOMEN')
+
 def convert_time(time_str):
     # Remove trailing 'M' if it exists
     if time_str[-1] == 'M':
         time_str = time_str[:-1]
 
-    # Parse the time string using datetime
-    col_count = time_str.count(':')
-    if col_count == 2:
-        time_format = '%H:%M:%S.%f'
-    elif col_count == 1:
-        time_format = '%M:%S.%f'
-    else:
-        time_format = '%S.%f'
-    time = datetime.strptime(time_str, time_format).time()
-    total_second = time.second + time.minute * 60 + time.hour * 3600 + time.microsecond / 1000000
-    return total_second
+    # Sum the whole seconds as integers and add the fraction last, so the
+    # result matches the value datetime.strptime used to produce
+    parts = time_str.split(':')
+    seconds, _, fraction = parts[-1].partition('.')
+    whole_seconds = int(seconds)
+    if len(parts) >= 2:
+        whole_seconds += int(parts[-2]) * 60
+    if len(parts) == 3:
+        whole_seconds += int(parts[0]) * 3600
+    return whole_seconds + int(fraction or 0) / 10 ** len(fraction)
+
+def _nfkd(text):
+    # ASCII text is already in NFKD form, so only decompose the rest
+    return text if text.isascii() else _nfkd_decompose(text)
+
+# Names of nations, cities and periods repeat across rows and pages
+@lru_cache(maxsize=4096)
+def _nfkd_decompose(text):
+    return normalize("NFKD", text)
+
+def _request_key(params):
+    # requests drops None values and sends every value as a string, so
+    # {'meetId': 123} and {'meetId': '123'} request the same page
+    return tuple(sorted((k, str(v)) for k, v in params.items() if v is not None))
+
+def _parse_page(content, page):
+    return BeautifulSoup(content, builder=_LXML_BUILDER, from_encoding='utf-8', parse_only=_PAGE_STRAINERS.get(page))
 
 class SessionManager:
     """
-    Manages an HTTP session, tracks request history, and enforces request rate limits.
+    Manages an HTTP session and enforces request rate limits with a token bucket.
 
     Attributes:
     - `session`: An instance of `requests.Session` for making HTTP requests.
-    - `request_history`: A list to track the timestamp of each request.
     - `last_updated`: Timestamp of the last request.
-    - `max_requests_per_second`: Maximum allowed requests per second.
-    - `max_per`: Timeframe in seconds within which the maximum requests are allowed.
+    - `capacity`: Maximum number of requests that can be made in a burst.
+    - `rate`: Number of requests that become available again per second.
+    - `tokens`: Number of requests currently available.
+    - `last_refill`: Monotonic timestamp of the last token refill.
 
     Methods:
-    - `add_request()`: Adds a request timestamp to the request history.
-    - `check_request_rate_limit()`: Checks and enforces the request rate limit.
+    - `acquire()`: Takes a token from the bucket, waiting if none is available.
+    - `is_cached(url, params)`: Checks whether a fresh response for the request is stored in the on-disk cache.
     - `get_session()`: Retrieves the requests session.
 
     Usage Example:
     ```python
     manager = SessionManager()
-    manager.add_request()
-    manager.check_request_rate_limit()
+    manager.acquire()
     session = manager.get_session()
     ```
 
     Rate Limiting:
-    - The rate limit is defined by `max_requests_per_second` within the timeframe of `max_per` seconds.
-    - If the rate limit is reached, the function pauses execution to comply with the limit.
+    - The bucket holds at most `max_requests_per_timeframe[0]` tokens and refills at a rate of
+      `max_requests_per_timeframe[0]` tokens per `max_requests_per_timeframe[1]` seconds.
+    - If the bucket is empty, the function pauses execution until a token becomes available.
+    - `acquire()` is thread-safe, so a single SessionManager can throttle requests made from several threads.
+
+    Caching:
+    - Pass `cache_name` to store responses in a SQLite database (requires the `requests-cache` package).
+    - Cached responses are reused for `expire_after` seconds, also across processes, and do not count towards the rate limit.
+    - Result pages do not change once published and are reused for a day, regardless of `expire_after`.
+    - If a request fails, an expired cached response is returned instead of the error.
+
+    Connection Handling:
+    - A single connection pool is mounted for the Swimrankings host so connections are kept alive between requests.
+    - Requests that fail with a connection error or a 429/5xx status are retried up to 3 times with exponential backoff.
 
     Note:
-    - Ensure to call `add_request()` before making each request.
+    - Ensure to call `acquire()` before making each request.
     - Use `get_session()` to obtain the requests session for making HTTP requests.
     """
-    def __init__(self, max_requests_per_timeframe=(15, 30)):
-        self.session = requests.Session()
-        self.request_history = []
+    def __init__(self, max_requests_per_timeframe=(15, 30), cache_name=None, expire_after=60):
+        if cache_name is None:
+            self.session = requests.Session()
+        else:
+            # requests-cache is an optional dependency, only needed for the on-disk cache
+            import requests_cache
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                backend='sqlite',
+                expire_after=expire_after,
+                urls_expire_after=_CACHE_URLS_EXPIRE_AFTER,
+                stale_if_error=True,
+            )
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.last_updated = None
-        self.max_requests_per_second = max_requests_per_timeframe[0]
-        self.max_per = max_requests_per_timeframe[1]
+        self.capacity = max_requests_per_timeframe[0]
+        self.rate = self.capacity / max_requests_per_timeframe[1]
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
 
-    def add_request(self):
+    def acquire(self):
         """
-        Adds a request timestamp to the request history.
+        Takes a token from the bucket, waiting until one is available if the bucket is empty.
         """
-        request_time = time.time()
-        self.request_history.append(request_time)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            # The deficit is paid back by the refill on the next call, so the
+            # wait can happen outside the lock
+            time_to_wait = -self.tokens / self.rate
+        if time_to_wait > 0:
+            time.sleep(time_to_wait)
 
-    def check_request_rate_limit(self):
-        """
-        Checks and enforces the request rate limit.
+    def is_cached(self, url, params):
         """
-        current_time = time.time()
-        window_start_time = current_time - self.max_per
-        valid_requests = [t for t in self.request_history if t > window_start_time]
+        Checks whether a fresh response for the request is stored in the on-disk cache.
 
-        if len(valid_requests) >= self.max_requests_per_second:
-            time_to_wait = valid_requests[0] + self.max_per - current_time
-            # print(f"Request rate limit reached. Waiting for {time_to_wait:.2f} seconds.")
-            time.sleep(time_to_wait)
-            self.request_history = [t for t in self.request_history if t > window_start_time + time_to_wait]
+        Parameters:
+        - `url` (str): The URL of the request.
+        - `params` (dict): The parameters to be included in the request.
+
+        Returns:
+        - bool: True if the request will be answered from the cache.
+        """
+        cache = getattr(self.session, 'cache', None)
+        if cache is None:
+            return False
+        request = self.session.prepare_request(requests.Request('GET', url, params=params))
+        response = cache.get_response(cache.create_key(request))
+        return response is not None and not response.is_expired
 
     def get_session(self):
         """
@@ -138,6 +235,72 @@ class SessionManager:
         return self.session
 
 
+class AsyncSessionManager:
+    """
+    Manages an asynchronous HTTP/2 client and enforces request rate limits with a token bucket.
+
+    Attributes:
+    - `client`: An instance of `httpx.AsyncClient` for making HTTP requests.
+    - `capacity`: Maximum number of requests that can be made in a burst.
+    - `rate`: Number of requests that become available again per second.
+    - `tokens`: Number of requests currently available.
+    - `last_refill`: Monotonic timestamp of the last token refill.
+
+    Methods:
+    - `acquire()`: Takes a token from the bucket, waiting if none is available.
+    - `get_client()`: Retrieves the httpx client.
+    - `aclose()`: Closes the httpx client.
+
+    Usage Example:
+    ```python
+    manager = AsyncSessionManager()
+    athletes = [Athlete(athlete_id, manager) for athlete_id in ['4292888', '4787911']]
+    personal_bests = await asyncio.gather(*(athlete.list_personal_bests_async() for athlete in athletes))
+    await manager.aclose()
+    ```
+
+    Note:
+    - Requires the `httpx` package with HTTP/2 support (`pip install swimrankingsscraper[async]`).
+    - Requests share one multiplexed connection, so concurrent requests are only limited by the token bucket.
+    - The bucket works like the one in `SessionManager`, but waits with `asyncio.sleep()` instead of blocking.
+    """
+    def __init__(self, max_requests_per_timeframe=(15, 30)):
+        if httpx is None:
+            raise ImportError("AsyncSessionManager requires httpx, install it with 'pip install swimrankingsscraper[async]'")
+        self.client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=16, max_keepalive_connections=16))
+        self.capacity = max_requests_per_timeframe[0]
+        self.rate = self.capacity / max_requests_per_timeframe[1]
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    async def acquire(self):
+        """
+        Takes a token from the bucket, waiting until one is available if the bucket is empty.
+        """
+        # No lock is needed, the bookkeeping does not yield to the event loop
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def get_client(self):
+        """
+        Retrieves the httpx client.
+
+        Returns:
+        - httpx.AsyncClient: The httpx client.
+        """
+        return self.client
+
+    async def aclose(self):
+        """
+        Closes the httpx client.
+        """
+        await self.client.aclose()
+
+
 class SwimrankingsScraper:
     """
     Main class for the Swimrankings web scraper.
@@ -147,12 +310,13 @@ class SwimrankingsScraper:
     - `sessionManager` (SessionManager): An instance of SessionManager for managing HTTP requests.
 
     Methods:
-    - `__init__()`: Initializes the SwimrankingsScraper with the base URL and a requests session.
+    - `__init__(sessionManager=None)`: Initializes the SwimrankingsScraper with the base URL and a requests session.
     - `get_athlete(athlete_id)`: Retrieves an Athlete instance for the specified athlete ID.
     - `get_meet(meet_id)`: Retrieves a Meet instance for the specified meet ID.
     - `get_results(result_id)`: Retrieves a Result instance for the specified result ID.
     - `get_meets()`: Retrieves a Meets instance.
     - `get_club(club_id)`: Retrieves a Club instance for the specified club ID.
+    - `map(fn, ids, workers=8)`: Applies a function to each ID concurrently and returns the results in order.
 
     Usage Example:
     ```python
@@ -162,20 +326,24 @@ class SwimrankingsScraper:
     result_instance = scraper.get_results('789012')
     meets_instance = scraper.get_meets()
     club_instance = scraper.get_club('987654')
+    personal_bests = scraper.map(lambda athlete_id: scraper.get_athlete(athlete_id).list_personal_bests(), ['4292888', '4787911'])
     ```
 
     Details:
     - The class provides methods to obtain instances for Athlete, Meet, Result, Meets, and Club.
     - These instances allow accessing various functionalities related to athletes, meets, and results.
-    - The SessionManager is used for handling HTTP requests.
+    - The SessionManager is used for handling HTTP requests. Pass an AsyncSessionManager to use the `*_async` methods instead.
     - Instantiate this class to start using the Swimrankings web scraper functionalities.
     """
-    def __init__(self):
+    def __init__(self, sessionManager=None):
         """
         Initializes the SwimrankingsScraper with the base URL and a requests session.
+
+        Parameters:
+        - `sessionManager` (SessionManager or AsyncSessionManager): The session manager to use. Defaults to a new SessionManager.
         """
         self.url = BASE_URL
-        self.sessionManager = SessionManager()
+        self.sessionManager = sessionManager if sessionManager is not None else SessionManager()
 
     def get_athlete(self, athlete_id):
         """
@@ -234,6 +402,23 @@ class SwimrankingsScraper:
         """
         return Club(club_id, self.sessionManager)
 
+    def map(self, fn, ids, workers=8):
+        """
+        Applies a function to each ID using a pool of threads.
+
+        The requests made by `fn` share this scraper's SessionManager, so they stay within its rate limit.
+
+        Parameters:
+        - `fn` (callable): The function to apply to each ID.
+        - `ids` (iterable): The IDs to pass to `fn`.
+        - `workers` (int): The maximum number of threads to use.
+
+        Returns:
+        - `list`: The results of `fn`, in the same order as `ids`.
+        """
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(fn, ids))
+
 
 class ScraperMixin:
     """
@@ -242,13 +427,20 @@ class ScraperMixin:
     Attributes:
     - `sessionManager` (SessionManager): The SessionManager instance for making HTTP requests.
     - `page_content` (BeautifulSoup or None): The HTML content of the last fetched page, parsed with BeautifulSoup.
+    - `_tables_cache` (dict): Tables already located in a page, stored with the page they were found in and cleared whenever the page is updated.
+    - `_pages` (OrderedDict): The most recently requested pages and their update times, keyed by request.
+    - `_lock` (threading.RLock): Serializes `_get_page_content(params)` when the instance is shared between threads.
     - `update_interval` (int): The minimum time interval (in seconds) between consecutive updates.
-    - `last_updated` (float): The timestamp of the last page update.
+    - `last_updated` (float): The monotonic timestamp of the last page update.
 
     Methods:
     - `__init__(sessionManager, update_interval=60, max_requests_per_minute=30)`: Initializes the ScraperMixin with a requests session.
     - `_update_page_content(params)`: Updates the page content with the HTML content of a page with the specified parameters.
     - `_get_page_content(params)`: Retrieves the HTML content of a page with the specified parameters.
+    - `_switch_page(key)`: Makes the page of a request the current page.
+    - `_remember_page(key)`: Stores the current page in the recently requested pages.
+    - `_update_page_content_async(params)`: Fetches and returns the page with the specified parameters, without blocking the event loop.
+    - `_get_page_content_async(params)`: Asynchronous variant of `_get_page_content(params)`.
 
     Usage Example:
     ```python
@@ -264,6 +456,10 @@ class ScraperMixin:
     - `sessionManager` is required for making HTTP requests, and `update_interval` sets the minimum time between updates.
     - Use `_get_page_content(params)` to retrieve HTML content, and `_update_page_content(params)` to force an update.
     - The page content is stored in the `page_content` attribute, parsed with BeautifulSoup.
+    - The last few requested pages are kept, so alternating between pages only fetches each page once per `update_interval`.
+    - The asynchronous variants require an `AsyncSessionManager`. The `*_async` methods of the scraper classes
+      fetch the page with them and then parse the returned page with the same helper as their synchronous counterpart.
+      Building the BeautifulSoup tree runs in a worker thread, so it does not block other requests on the event loop.
     - Implement this mixin in other scraper classes to share common functionality.
     """
     def __init__(self, sessionManager, update_interval=60):
@@ -276,9 +472,14 @@ class ScraperMixin:
         """
         self.sessionManager = sessionManager
         self.last_request = None
+        self._last_key = None
         self.page_content = None
         self.update_interval = update_interval
         self.last_updated = None
+        self._tables_cache = {}
+        self._pages = OrderedDict()
+        # Serializes page updates when one instance is shared between threads
+        self._lock = threading.RLock()
 
     def _update_page_content(self, params):
         """
@@ -287,15 +488,19 @@ class ScraperMixin:
         Parameters:
         - `params` (dict): The parameters to be included in the request.
         """
+        self._tables_cache.clear()
         try:
-            self.sessionManager.check_request_rate_limit()
+            if not self.sessionManager.is_cached(BASE_URL, params):
+                self.sessionManager.acquire()
             page = self.sessionManager.get_session().get(BASE_URL, params=params)
             page.raise_for_status()  # Raise HTTPError for bad requests
-            self.page_content =  BeautifulSoup(page.content, "lxml")
-            self.last_updated = time.time()
-            self.sessionManager.add_request()
-            if self.page_content.find('body') is None:
+            # Check the raw bytes, so an empty page is rejected before it is parsed.
+            # lxml adds a body to any other document, so the tag itself is not required.
+            if not page.content.strip():
+                self.page_content = None
                 raise requests.RequestException("Empty response")
+            self.page_content = _parse_page(page.content, params.get('page'))
+            self.last_updated = time.monotonic()
         except requests.RequestException as e:
             print(f"Error fetching data: {e}") 
 
@@ -309,10 +514,92 @@ class ScraperMixin:
         Returns:
         - `str` or `None`: The HTML content of the page or `None` if an error occurs.
         """
-        if self.last_updated is None or params != self.last_request or time.time() - self.last_updated > self.update_interval:
-            self._update_page_content(params)
+        key = _request_key(params)
+        with self._lock:
+            self._switch_page(key)
+            if self.last_updated is None or time.monotonic() - self.last_updated > self.update_interval:
+                self._update_page_content(params)
+            self._remember_page(key)
+            self.last_request = params
+            return self.page_content
+
+    def _switch_page(self, key):
+        """
+        Makes the page of a request the current page, restoring it from the recently requested pages if possible.
+
+        Parameters:
+        - `key` (tuple): The key of the request, as returned by `_request_key(params)`.
+        """
+        if key != self._last_key:
+            self._tables_cache.clear()
+            self.page_content, self.last_updated = self._pages.get(key, (None, None))
+            self._last_key = key
+
+    def _remember_page(self, key):
+        """
+        Stores the current page in the recently requested pages, evicting the least recently used one when full.
+
+        Parameters:
+        - `key` (tuple): The key of the request, as returned by `_request_key(params)`.
+        """
+        self._pages[key] = (self.page_content, self.last_updated)
+        self._pages.move_to_end(key)
+        if len(self._pages) > _PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+
+    async def _update_page_content_async(self, params):
+        """
+        Fetches and parses the page with the specified parameters, without blocking the event loop.
+
+        The page is returned instead of stored, so requests that overlap on the same instance
+        cannot overwrite each other's page.
+
+        Parameters:
+        - `params` (dict): The parameters to be included in the request.
+
+        Returns:
+        - `BeautifulSoup` or `None`: The parsed page or `None` if an error occurs.
+        """
+        try:
+            await self.sessionManager.acquire()
+            # requests drops parameters that are None, httpx would send them empty
+            page = await self.sessionManager.get_client().get(BASE_URL, params={k: v for k, v in params.items() if v is not None})
+            page.raise_for_status()  # Raise HTTPStatusError for bad requests
+            if not page.content.strip():
+                raise httpx.HTTPError("Empty response")
+            # Parse in a worker thread, so other requests keep running meanwhile
+            return await asyncio.to_thread(_parse_page, page.content, params.get('page'))
+        except httpx.HTTPError as e:
+            print(f"Error fetching data: {e}")
+            return None
+
+    async def _get_page_content_async(self, params):
+        """
+        Retrieves the HTML content of a page with the specified parameters, without blocking the event loop.
+
+        Parameters:
+        - `params` (dict): The parameters to be included in the request.
+
+        Returns:
+        - `str` or `None`: The HTML content of the page or `None` if an error occurs.
+        """
+        key = _request_key(params)
+        if key == self._last_key:
+            page_content, last_updated = self.page_content, self.last_updated
+        else:
+            page_content, last_updated = self._pages.get(key, (None, None))
+        if last_updated is None or time.monotonic() - last_updated > self.update_interval:
+            page = await self._update_page_content_async(params)
+            if page is not None:
+                page_content, last_updated = page, time.monotonic()
+        # Other requests on this instance may have switched pages during the await,
+        # so the current page is only set now, from this request's own page
+        if key != self._last_key or page_content is not self.page_content:
+            self._tables_cache.clear()
+        self.page_content, self.last_updated, self._last_key = page_content, last_updated, key
+        self._remember_page(key)
         self.last_request = params
-        return self.page_content
+        return page_content
 
 
 class Athlete(ScraperMixin):
@@ -328,6 +615,8 @@ class Athlete(ScraperMixin):
     - `__init__(athlete_id, sessionManager, update_interval=60)`: Initializes the Athlete with an athlete ID and a requests session.
     - `list_personal_bests() -> list`: Retrieves a list of personal bests for the athlete.
     - `list_meets() -> list`: Retrieves a list of meets in which the athlete has participated.
+    - `iter_personal_bests()`, `iter_meets()`: Generator variants of the methods above that yield one dictionary at a time.
+    - `*_async(...)`: Asynchronous variants of the methods above, for use with an `AsyncSessionManager`.
 
     Usage Example:
     ```python
@@ -367,26 +656,59 @@ class Athlete(ScraperMixin):
         Returns:
         - `list`: A list of dictionaries containing information about each personal best.
         """
-        params = {'page': 'athleteDetail', 'athleteId': self.athlete_id, 'pbest': season}
+        return list(self.iter_personal_bests(season))
+
+    def iter_personal_bests(self, season="-1"):
+        """
+        Iterates over the personal bests of the athlete, parsing each row only when it is requested.
+
+        Yields:
+        - `dict`: A dictionary containing information about a personal best.
+        """
+        yield from self._parse_personal_bests(self._get_page_content(self._personal_bests_params(season)))
+
+    def _personal_bests_params(self, season):
+        """
+        Returns the request parameters of the personal bests page.
+        """
+        return {'page': 'athleteDetail', 'athleteId': self.athlete_id, 'pbest': season}
+
+    def _parse_personal_bests(self, soup):
+        """
+        Parses the personal bests from a personal bests page.
+
+        Parameters:
+        - `soup` (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - `dict`: A dictionary containing information about a personal best.
+        """
         try:
-            soup = self._get_page_content(params)
             table = soup.find('table', {'class': 'athleteBest'})
         except AttributeError:
-            return []
+            return
 
-        data = []
-        for row in table.find_all('tr', {'class': ['athleteBest0', 'athleteBest1']}):
-            event_cell = row.find('td', {'class': 'event'})
+        for row in table.find_all('tr', {'class': ['athleteBest0', 'athleteBest1']}, recursive=False):
+            event_cell = row.find('td', {'class': 'event'}, recursive=False)
             event_name = event_cell.find('a').get_text(strip=True)
-            course_cell = row.find('td', {'class': 'course'})
-            course_length = course_cell.get_text(strip=True)
-            time_cell = row.find('td', {'class': ['time', 'swimtimeImportant']})
+            course_cell = row.find('td', {'class': 'course'}, recursive=False)
+            course_length = intern(course_cell.get_text(strip=True))
+            time_cell = row.find('td', {'class': ['time', 'swimtimeImportant']}, recursive=False)
             time = convert_time(time_cell.get_text(strip=True))
             result_url = time_cell.find('a')['href']
-            result_id = int(parse_qs(urlparse(result_url).query)['id'][0])
-            fina_points = row.find('td', {'class': 'code'}).get_text(strip=True)
-            data.append({'result_id': result_id, 'event_name': event_name, 'course_length': course_length, 'time': time, 'FINA Points': fina_points})
-        return data
+            result_id = int(_RESULT_ID_RE.search(result_url).group(1))
+            fina_points = row.find('td', {'class': 'code'}, recursive=False).get_text(strip=True)
+            yield {'result_id': result_id, 'event_name': event_name, 'course_length': course_length, 'time': time, 'FINA Points': fina_points}
+
+    async def list_personal_bests_async(self, season="-1") -> list:
+        """
+        Asynchronous variant of `list_personal_bests()`.
+
+        Returns:
+        - `list`: A list of dictionaries containing information about each personal best.
+        """
+        soup = await self._get_page_content_async(self._personal_bests_params(season))
+        return list(self._parse_personal_bests(soup))
 
     def list_meets(self) -> list:
         """
@@ -395,24 +717,58 @@ class Athlete(ScraperMixin):
         Returns:
         - `list`: A list of dictionaries containing information about each meet.
         """
-        params = {'page': 'athleteDetail', 'athleteId': self.athlete_id, 'athletePage': 'MEET'}
+        return list(self.iter_meets())
+
+    def iter_meets(self):
+        """
+        Iterates over the meets in which the athlete has participated, parsing each row only when it is requested.
+
+        Yields:
+        - `dict`: A dictionary containing information about a meet.
+        """
+        yield from self._parse_meets(self._get_page_content(self._meets_params()))
+
+    def _meets_params(self):
+        """
+        Returns the request parameters of the meets page.
+        """
+        return {'page': 'athleteDetail', 'athleteId': self.athlete_id, 'athletePage': 'MEET'}
+
+    def _parse_meets(self, soup):
+        """
+        Parses the meets from a meets page.
+
+        Parameters:
+        - `soup` (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - `dict`: A dictionary containing information about a meet.
+        """
         try:
-            soup = self._get_page_content(params)
             table = soup.find('table', {'class': 'athleteMeet'})
         except AttributeError:
-            return []
+            return
+
+        for row in table.find_all('tr', {'class': ['athleteMeet0', 'athleteMeet1']}, recursive=False):
+            date_cell = row.find('td', {'class': 'date'}, recursive=False)
+            meet_date = _nfkd(date_cell.get_text(strip=True))
+            city_link = row.find('td', {'class': 'city'}, recursive=False).find('a')
+            meet_city = city_link.get_text(strip=True)
+            meet_name = city_link['title']
+            meet_url = city_link['href']
+            meet_id = int(_MEET_ID_RE.search(meet_url).group(1))
+            yield {'meet_id': meet_id, 'meet_date': meet_date, 'meet_city': meet_city, 'meet_name': meet_name}
+
+    async def list_meets_async(self) -> list:
+        """
+        Asynchronous variant of `list_meets()`.
+
+        Returns:
+        - `list`: A list of dictionaries containing information about each meet.
+        """
+        soup = await self._get_page_content_async(self._meets_params())
+        return list(self._parse_meets(soup))
 
-        data = []
-        for row in table.find_all('tr', {'class': ['athleteMeet0', 'athleteMeet1']}):
-            date_cell = row.find('td', {'class': 'date'})
-            meet_date = unicodedata.normalize("NFKD", date_cell.get_text(strip=True))
-            city_cell = row.find('td', {'class': 'city'})
-            meet_city = city_cell.find('a').get_text(strip=True)
-            meet_name = city_cell.find('a')['title']
-            meet_url = city_cell.find('a')['href']
-            meet_id = int(parse_qs(urlparse(meet_url).query)['meetId'][0])
-            data.append({'meet_id': meet_id, 'meet_date': meet_date, 'meet_city': meet_city, 'meet_name': meet_name})
-        return data
 
 class Meet(ScraperMixin):
     """
@@ -429,6 +785,8 @@ class Meet(ScraperMixin):
     - `list_events() -> list`: Retrieves a list of events that took place in the meet.
     - `list_races(event_id, gender) -> list`: Retrieves a list of different races within the same event in the meet.
     - `list_results(event_id, gender, race_id) -> list`: Retrieves a list of results for a specific event in the meet.
+    - `iter_clubs()`, `iter_results(event_id, gender, race_id)`: Generator variants of the methods above that yield one dictionary at a time.
+    - `*_async(...)`: Asynchronous variants of the methods above, for use with an `AsyncSessionManager`.
 
     Usage Example:
     ```python
@@ -476,23 +834,61 @@ class Meet(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each club.
         """
-        params = {'page': 'meetDetail', 'meetId': self.meet_id}
+        return list(self.iter_clubs())
+
+    def iter_clubs(self):
+        """
+        Iterates over the clubs that participated in the meet, parsing each row only when it is requested.
+
+        Yields:
+        - dict: A dictionary containing information about a club.
+        """
+        yield from self._parse_clubs(self._get_page_content(self._detail_params()))
+
+    def _detail_params(self):
+        """
+        Returns the request parameters of the meet page.
+        """
+        return {'page': 'meetDetail', 'meetId': self.meet_id}
+
+    def _event_params(self, event_id, gender):
+        """
+        Returns the request parameters of the results page of an event.
+        """
+        return {'page': 'meetDetail', 'meetId': self.meet_id, 'gender': gender, 'styleId': event_id}
+
+    def _parse_clubs(self, soup):
+        """
+        Parses the clubs from a meet page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - dict: A dictionary containing information about a club.
+        """
         try:
-            soup = self._get_page_content(params)
             table = soup.find('table', {'class': 'meetSearch'})
         except AttributeError:
-            return []
+            return
 
-        data = []
-        for row in table.find_all('tr', {'class': ['meetResult0', 'meetResult1']}):
-            club_cell = row.find('td', {'class': 'club'})
-            club_url = club_cell.find('a')['href']
-            club_id = parse_qs(urlparse(club_url).query)['clubId'][0]
-            club_name = club_cell.find('a').get_text(strip=True)
+        for row in table.find_all('tr', {'class': ['meetResult0', 'meetResult1']}, recursive=False):
+            club_link = row.find('td', {'class': 'club'}, recursive=False).find('a')
+            club_url = club_link['href']
+            club_id = _CLUB_ID_RE.search(club_url).group(1)
+            club_name = club_link.get_text(strip=True)
 
-            data.append({'club_id': club_id, 'club_name': club_name})
+            yield {'club_id': club_id, 'club_name': club_name}
 
-        return data
+    async def list_clubs_async(self):
+        """
+        Asynchronous variant of `list_clubs()`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each club.
+        """
+        soup = await self._get_page_content_async(self._detail_params())
+        return list(self._parse_clubs(soup))
 
     def list_events(self):
         """
@@ -501,27 +897,68 @@ class Meet(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each event.
         """
-        params = {'page': 'meetDetail', 'meetId': self.meet_id} 
+        return self._parse_events(self._get_page_content(self._detail_params()))
+
+    def _parse_events(self, soup):
+        """
+        Parses the events from a meet page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Returns:
+        - list: A list of dictionaries containing information about each event.
+        """
         try:
-            soup = self._get_page_content(params)
             table = soup.find('table', {'class': 'navigation'})
         except AttributeError:
             return []
         data = []
+        # Only the navigation cells can hold the event menus, so search their text instead of every tag
+        cells = table.find_all('td', {'class': 'navigation'})
         # Add Men's events
         search_text = "Men's events: "
-        menu = table.find(lambda tag: tag.name == 'td' and tag['class'][0] == 'navigation' and search_text in tag.text)
+        menu = next((cell for cell in cells if search_text in cell.get_text()), None)
         for item in menu.find_all('option'):
             if item['value'] != "0":
                 data.append({'event_id': item['value'], 'event_gender': '1', 'event_name': item.get_text(strip=True)})
         # Add Women's events
         search_text = "Women's events: "
-        menu = table.find(lambda tag: tag.name == 'td' and tag['class'][0] == 'navigation' and search_text in tag.text)
+        menu = next((cell for cell in cells if search_text in cell.get_text()), None)
         for item in menu.find_all('option'):
             if item['value'] != "0":
                 data.append({'event_id': item['value'], 'event_gender': '2', 'event_name': item.get_text(strip=True)})
         return data
 
+    async def list_events_async(self):
+        """
+        Asynchronous variant of `list_events()`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each event.
+        """
+        soup = await self._get_page_content_async(self._detail_params())
+        return self._parse_events(soup)
+
+    def _get_result_tables(self, soup, event_id, gender):
+        """
+        Retrieves the result tables of an event, reusing the tables found by a previous call on the same page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed results page of the event.
+        - event_id (str): The ID of the event.
+        - gender (str): 1 for male, 2 for female.
+
+        Returns:
+        - list: The result tables, one for each race.
+        """
+        cached = self._tables_cache.get((event_id, gender))
+        if cached is not None and cached[0] is soup:
+            return cached[1]
+        tables = soup.find_all('table', {'class': 'meetResult'})
+        self._tables_cache[(event_id, gender)] = (soup, tables)
+        return tables
+
     def list_races(self, event_id, gender):
         """
         Retrieves a list of different races within the same event in the meet.
@@ -533,20 +970,41 @@ class Meet(ScraperMixin):
         returns:
         - list: A list of dictionaries containing information about each race.
         """
-        params = {'page': 'meetDetail', 'meetId': self.meet_id, 'gender': gender, 'styleId': event_id}
+        return self._parse_races(self._get_page_content(self._event_params(event_id, gender)), event_id, gender)
+
+    def _parse_races(self, soup, event_id, gender):
+        """
+        Parses the races from the results page of an event.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+        - event_id (str): The ID of the event.
+        - gender (str): 1 for male, 2 for female.
+
+        Returns:
+        - list: A list of dictionaries containing information about each race.
+        """
         try:
-            soup = self._get_page_content(params)
-            tables = soup.find_all('table', {'class': 'meetResult'})
+            tables = self._get_result_tables(soup, event_id, gender)
         except AttributeError:
             return []
         races = []
         for (id, table) in enumerate(tables):
             head = table.find('tr', {'class': 'meetResultHead'})
             name_cell = head.find('th', {'class': 'event'})
-            name = unicodedata.normalize("NFKD", name_cell.get_text(strip=True))
+            name = _nfkd(name_cell.get_text(strip=True))
             races.append({'race_id': id+1, 'race_name': name})
         return races           
 
+    async def list_races_async(self, event_id, gender):
+        """
+        Asynchronous variant of `list_races(event_id, gender)`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each race.
+        """
+        soup = await self._get_page_content_async(self._event_params(event_id, gender))
+        return self._parse_races(soup, event_id, gender)
 
     def list_results(self, event_id, gender, race_id):
         """
@@ -560,34 +1018,63 @@ class Meet(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each result.
         """
-        params = {'page': 'meetDetail', 'meetId': self.meet_id, 'gender': gender, 'styleId': event_id}
+        return list(self.iter_results(event_id, gender, race_id))
+
+    def iter_results(self, event_id, gender, race_id):
+        """
+        Iterates over the results for a specific event in the meet, parsing each row only when it is requested.
+
+        Parameters:
+        - event_id (str): The ID of the event.
+        - gender (str): 1 for male, 2 for female.
+        - race_id (int): a number coronsponding with a specific race.
+
+        Yields:
+        - dict: A dictionary containing information about a result.
+        """
+        yield from self._parse_results(self._get_page_content(self._event_params(event_id, gender)), event_id, gender, race_id)
+
+    def _parse_results(self, soup, event_id, gender, race_id):
+        """
+        Parses the results of a race from the results page of an event.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+        - event_id (str): The ID of the event.
+        - gender (str): 1 for male, 2 for female.
+        - race_id (int): a number coronsponding with a specific race.
+
+        Yields:
+        - dict: A dictionary containing information about a result.
+        """
         try:
-            soup = self._get_page_content(params)
-            tables = soup.find_all('table', {'class': 'meetResult'})
+            tables = self._get_result_tables(soup, event_id, gender)
         except AttributeError:
-            return []
-        results = []
-        for row in tables[race_id-1].find_all('tr', {'class': ['meetResult0', 'meetResult1']}):
-            name_cell = row.find('td', {'class': 'name'})
-            name = name_cell.find('a').get_text(strip=True)
-            name_url = name_cell.find('a')['href']
-            athlete_id = parse_qs(urlparse(name_url).query)['athleteId'][0]
-            club_cell = row.find_all('td', {'class': 'name'})[1]
-            club_name = club_cell.find('a').get_text(strip=True)
-            time_cell = row.find('td', {'class': 'swimtime'})
-            time = time_cell.find('a').get_text(strip=True)
-            try:
-                split_times_rough = time_cell.find('a')['onmouseover']
-            except KeyError:
-                split_times_rough = ""
-            pattern = r"<td class=\\'split1\\'>(.*?)<\/td>"
-            split_times = re.findall(pattern, split_times_rough)
-            result_url = time_cell.find('a')['href']
-            result_id = parse_qs(urlparse(result_url).query)['id'][0]
-            results.append({'result_id': result_id, 'athlete_id': athlete_id, 'name': name, 'club_name': club_name, 'time': time, 'split_times': split_times})
-        return results
-
+            return
+        for row in tables[race_id-1].find_all('tr', {'class': ['meetResult0', 'meetResult1']}, recursive=False):
+            name_cell, club_cell = row.find_all('td', {'class': 'name'}, limit=2, recursive=False)
+            name_link = name_cell.find('a')
+            name = name_link.get_text(strip=True)
+            name_url = name_link['href']
+            athlete_id = _ATHLETE_ID_RE.search(name_url).group(1)
+            club_name = intern(club_cell.find('a').get_text(strip=True))
+            time_link = row.find('td', {'class': 'swimtime'}, recursive=False).find('a')
+            time = time_link.get_text(strip=True)
+            split_times_rough = time_link.get('onmouseover', "")
+            split_times = _SPLIT_TIME_RE.findall(split_times_rough)
+            result_url = time_link['href']
+            result_id = _RESULT_ID_RE.search(result_url).group(1)
+            yield {'result_id': result_id, 'athlete_id': athlete_id, 'name': name, 'club_name': club_name, 'time': time, 'split_times': split_times}
+
+    async def list_results_async(self, event_id, gender, race_id):
+        """
+        Asynchronous variant of `list_results(event_id, gender, race_id)`.
 
+        Returns:
+        - list: A list of dictionaries containing information about each result.
+        """
+        soup = await self._get_page_content_async(self._event_params(event_id, gender))
+        return list(self._parse_results(soup, event_id, gender, race_id))
 
 
 class Result(ScraperMixin):
@@ -602,6 +1089,7 @@ class Result(ScraperMixin):
     Methods:
     - `__init__(result_id, sessionManager, update_interval=60)`: Initializes the Result with a result ID and a requests session.
     - `get_time() -> str or None`: Retrieves the time recorded for the swimming result.
+    - `*_async(...)`: Asynchronous variants of the methods above, for use with an `AsyncSessionManager`.
 
     Usage Example:
     ```python
@@ -638,14 +1126,40 @@ class Result(ScraperMixin):
         Returns:
         - str: The time recorded for the result.
         """
-        params = {'page': 'resultDetail', 'id': self.result_id}
+        return self._parse_time(self._get_page_content(self._detail_params()))
+
+    def _detail_params(self):
+        """
+        Returns the request parameters of the result page.
+        """
+        return {'page': 'resultDetail', 'id': self.result_id}
+
+    def _parse_time(self, soup):
+        """
+        Parses the recorded time from a result page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Returns:
+        - str: The time recorded for the result.
+        """
         try:
-            soup = self._get_page_content(params)
             data = soup.find('td', {'class': 'swimtimeLarge'}).text
         except AttributeError:
             return None
         return data
-    
+
+    async def get_time_async(self):
+        """
+        Asynchronous variant of `get_time()`.
+
+        Returns:
+        - str: The time recorded for the result.
+        """
+        soup = await self._get_page_content_async(self._detail_params())
+        return self._parse_time(soup)
+
 
 class Meets(ScraperMixin):
     """
@@ -660,6 +1174,8 @@ class Meets(ScraperMixin):
     - `list_periods() -> List[Dict[str, Union[str, int]]]`: Retrieves a list of periods.
     - `list_nations() -> List[Dict[str, Union[str, int]]]`: Retrieves a list of nations.
     - `list_meets(nation_id=None, period_id='RECENT') -> List[Dict[str, Union[str, int]]]`: Retrieves a list of meets.
+    - `iter_time_periods()`, `iter_nations()`, `iter_meets(nation_id=None, time_period_id='RECENT')`: Generator variants of the methods above that yield one dictionary at a time.
+    - `*_async(...)`: Asynchronous variants of the methods above, for use with an `AsyncSessionManager`.
 
     Usage Example:
     ```python
@@ -694,17 +1210,50 @@ class Meets(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each time period.
         """
-        params = {'page': 'meetSelect', 'nationId': '0', 'selectPage': 'RECENT'}
+        return list(self.iter_time_periods())
+
+    def iter_time_periods(self):
+        """
+        Iterates over the periods, parsing each option only when it is requested.
+
+        Yields:
+        - dict: A dictionary containing information about a time period.
+        """
+        yield from self._parse_time_periods(self._get_page_content(self._select_params()))
+
+    def _select_params(self, nation_id='0', time_period_id='RECENT'):
+        """
+        Returns the request parameters of the meet selection page.
+        """
+        return {'page': 'meetSelect', 'nationId': nation_id, 'selectPage': time_period_id}
+
+    def _parse_time_periods(self, soup):
+        """
+        Parses the periods from a meet selection page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - dict: A dictionary containing information about a time period.
+        """
         try:
-            soup = self._get_page_content(params)
             menu = soup.find('select', {'name': 'selectPage'})
         except AttributeError:
-            return []
-        periods = []
-        for item in menu.find_all('option'):
+            return
+        for item in menu.find_all('option', recursive=False):
             if item['value'] != "RECENT" and item['value'] != "BYTYPE":
-                periods.append({'period_id': item['value'], 'period_name': unicodedata.normalize("NFKD", item.get_text(strip=True))})
-        return periods
+                yield {'period_id': item['value'], 'period_name': _nfkd(item.get_text(strip=True))}
+
+    async def list_time_periods_async(self):
+        """
+        Asynchronous variant of `list_time_periods()`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each time period.
+        """
+        soup = await self._get_page_content_async(self._select_params())
+        return list(self._parse_time_periods(soup))
 
     def list_nations(self):
         """
@@ -713,18 +1262,44 @@ class Meets(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each nation.
         """
-        params = {'page': 'meetSelect', 'nationId': '0', 'selectPage': 'RECENT'}
+        return list(self.iter_nations())
+
+    def iter_nations(self):
+        """
+        Iterates over the nations, parsing each option only when it is requested.
+
+        Yields:
+        - dict: A dictionary containing information about a nation.
+        """
+        yield from self._parse_nations(self._get_page_content(self._select_params()))
+
+    def _parse_nations(self, soup):
+        """
+        Parses the nations from a meet selection page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - dict: A dictionary containing information about a nation.
+        """
         try:
-            soup = self._get_page_content(params)
             menu = soup.find('select', {'name': 'nationId'})
         except AttributeError:
-            return []
-        nations = []
-        for item in menu.find_all('option'):
+            return
+        for item in menu.find_all('option', recursive=False):
             if item['value'] != "$$$":
-                nations.append({'nation_id': item['value'], 'nation_name': unicodedata.normalize("NFKD", item.get_text(strip=True))})
-        return nations
-        
+                yield {'nation_id': item['value'], 'nation_name': _nfkd(item.get_text(strip=True))}
+
+    async def list_nations_async(self):
+        """
+        Asynchronous variant of `list_nations()`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each nation.
+        """
+        soup = await self._get_page_content_async(self._select_params())
+        return list(self._parse_nations(soup))
 
     def list_meets(self, nation_id=None, time_period_id='RECENT'):
         """
@@ -737,27 +1312,62 @@ class Meets(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each meet.
         """
-        params = {'page': 'meetSelect', 'nationId': nation_id, 'selectPage': time_period_id}
+        return list(self.iter_meets(nation_id, time_period_id))
+
+    def iter_meets(self, nation_id=None, time_period_id='RECENT'):
+        """
+        Iterates over the meets, parsing each row only when it is requested.
+
+        Parameters:
+        - nation_id (str): The ID of the nation. Defaults to None.
+        - time_period_id (str): The ID of the time period. Defaults to 'RECENT'.
+
+        Yields:
+        - dict: A dictionary containing information about a meet.
+        """
+        yield from self._parse_meets(self._get_page_content(self._select_params(nation_id, time_period_id)))
+
+    def _parse_meets(self, soup):
+        """
+        Parses the meets from a meet selection page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - dict: A dictionary containing information about a meet.
+        """
         try:
-            soup = self._get_page_content(params)
             tables = soup.find_all('table', {'class': 'meetSearch'})
         except AttributeError:
-            return []
-        meets = []
+            return
         for table in tables:
-            for row in table.find_all('tr', {'class': ['meetSearch0', 'meetSearch1']}):
-                date_cell = row.find('td', {'class': 'date'})
-                meet_date = unicodedata.normalize("NFKD", date_cell.get_text(strip=True))
-                city_cell = row.find('td', {'class': 'city'})
-                meet_city = unicodedata.normalize("NFKD", city_cell.find('a').get_text(strip=True))
-                meet_url = city_cell.find('a')['href']
-                meet_name = row.find_all('td', {'class': 'name'})[1].find('a').get_text(strip=True)
-                course_cell = row.find('td', {'class': 'course'})
-                course_length = course_cell.get_text(strip=True)
-                meet_id = parse_qs(urlparse(meet_url).query)['meetId'][0]
-                meets.append({'meet_id': meet_id, 'meet_date': meet_date, 'meet_city': meet_city, 'meet_name': meet_name, 'course_length': course_length})
-        return meets
-    
+            for row in table.find_all('tr', {'class': ['meetSearch0', 'meetSearch1']}, recursive=False):
+                # Group the cells by class in a single pass over the row
+                cells = {}
+                for cell in row.find_all('td', recursive=False):
+                    for cell_class in cell.get('class', ()):
+                        cells.setdefault(cell_class, []).append(cell)
+                meet_date = _nfkd(cells['date'][0].get_text(strip=True))
+                city_link = cells['city'][0].find('a')
+                meet_city = _nfkd(city_link.get_text(strip=True))
+                meet_url = city_link['href']
+                meet_name = cells['name'][1].find('a').get_text(strip=True)
+                course_length = intern(cells['course'][0].get_text(strip=True))
+                meet_id = _MEET_ID_RE.search(meet_url).group(1)
+                yield {'meet_id': meet_id, 'meet_date': meet_date, 'meet_city': meet_city, 'meet_name': meet_name, 'course_length': course_length}
+
+    async def list_meets_async(self, nation_id=None, time_period_id='RECENT'):
+        """
+        Asynchronous variant of `list_meets(nation_id, time_period_id)`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each meet.
+        """
+        soup = await self._get_page_content_async(self._select_params(nation_id, time_period_id))
+        return list(self._parse_meets(soup))
+
+
 class Club(ScraperMixin):
     """
     Represents a club and provides methods to retrieve information about the club's athletes.
@@ -770,6 +1380,8 @@ class Club(ScraperMixin):
     Methods:
     - `__init__(sessionManager, club_id, update_interval=60)`: Initializes the Club with a requests session.
     - `list_athletes() -> List[Dict[str, Union[str, int]]]`: Retrieves a list of athletes in the club.
+    - `iter_athletes(gender=0)`: Generator variant of `list_athletes()` that yields one dictionary at a time.
+    - `*_async(...)`: Asynchronous variants of the methods above, for use with an `AsyncSessionManager`.
 
     Usage Example:
     ```python
@@ -806,27 +1418,67 @@ class Club(ScraperMixin):
         Returns:
         - list: A list of dictionaries containing information about each athlete.
         """
-        athlete_gender = ['CURRENT', 'ALL_MEN', 'All_WOMEN'][gender]
-        params = {'page': 'rankingDetail', 'clubId': self.club_id, 'stroke': '9', 'athleteGender': athlete_gender}
+        return list(self.iter_athletes(gender))
+
+    def iter_athletes(self, gender=0):
+        """
+        Iterates over the athletes, parsing each row only when it is requested.
+
+        Parameters:
+        - gender: 0 for ALL, 1 for Men, 2 for Women. Defaults to 0 this will only return currently active athletes.
+
+        Yields:
+        - dict: A dictionary containing information about an athlete.
+        """
+        yield from self._parse_athletes(self._get_page_content(self._ranking_params(gender)))
+
+    def _ranking_params(self, gender):
+        """
+        Returns the request parameters of the club ranking page for a gender.
+        """
+        return {'page': 'rankingDetail', 'clubId': self.club_id, 'stroke': '9', 'athleteGender': _ATHLETE_GENDERS[gender]}
+
+    def _parse_athletes(self, soup):
+        """
+        Parses the athletes from a club ranking page.
+
+        Parameters:
+        - soup (BeautifulSoup or None): The parsed page.
+
+        Yields:
+        - dict: A dictionary containing information about an athlete.
+        """
         try:
-            soup = self._get_page_content(params)
             tables = soup.find_all('table', {'class': 'athleteList'})
         except AttributeError:
-            return []
-        athletes = []
+            return
         for table in tables:
-            for row in table.find_all('tr', {'class': ['athleteSearch0', 'athleteSearch1']}):
-                name_cell = row.find('td', {'class': 'name'})
-                name = name_cell.find('a').get_text(strip=True)
-                athlete_url = name_cell.find('a')['href']
-                athlete_id = parse_qs(urlparse(athlete_url).query)['athleteId'][0]
+            for row in table.find_all('tr', {'class': ['athleteSearch0', 'athleteSearch1']}, recursive=False):
+                name_link = row.find('td', {'class': 'name'}, recursive=False).find('a')
+                name = name_link.get_text(strip=True)
+                athlete_url = name_link['href']
+                athlete_id = _ATHLETE_ID_RE.search(athlete_url).group(1)
                 # TODO: Add more information about the athlete (Gender)
-                athletes.append({'athlete_id': athlete_id, 'athlete_name': name})
-        return athletes   
+                yield {'athlete_id': athlete_id, 'athlete_name': name}
+
+    async def list_athletes_async(self, gender=0):
+        """
+        Asynchronous variant of `list_athletes(gender)`.
+
+        Returns:
+        - list: A list of dictionaries containing information about each athlete.
+        """
+        soup = await self._get_page_content_async(self._ranking_params(gender))
+        return list(self._parse_athletes(soup))
 
 
 if __name__ == '__main__':
     # Example usage
     scraper = SwimrankingsScraper()
     athelete = scraper.get_athlete('4292888')
-    print(athelete.list_personal_bests(season='2024'))
\ No newline at end of file
+    print(athelete.list_personal_bests(season='2024'))
+
+    # Fetch the personal bests of a whole club in parallel
+    club = scraper.get_club('65929')
+    athletes = [scraper.get_athlete(swimmer['athlete_id']) for swimmer in club.list_athletes()]
+    print(scraper.map(lambda athlete: athlete.list_personal_bests(), athletes))
\ No newline at end of file
@@ -1,12 +1,155 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from bs4 import BeautifulSoup
+from datetime import datetime, timedelta, timezone
+import io
+import os
+import tempfile
 import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
 import tests.values_for_testing as values_for_testing
-from swimrankingsscraper.swimrankingsscraper import SwimrankingsScraper, ScraperMixin, Athlete, Meet, Result, Meets, Club
+from swimrankingsscraper.swimrankingsscraper import convert_time, SwimrankingsScraper, SessionManager, AsyncSessionManager, ScraperMixin, Athlete, Meet, Result, Meets, Club
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 BASE_URL = 'https://www.swimrankings.net/index.php?'
 
+class TestConvertTime(unittest.TestCase):
+
+    def test_convert_time(self):
+        # Assertions
+        self.assertEqual(convert_time('25.68'), 25.68)
+        self.assertEqual(convert_time('2:11.50'), 131.5)
+        self.assertEqual(convert_time('1:10:39.86'), 4239.86)
+        self.assertEqual(convert_time('57.28M'), 57.28)
+
+class TestSessionManager(unittest.TestCase):
+
+    def test_init(self):
+        session_manager = SessionManager()
+        adapter = session_manager.get_session().get_adapter(BASE_URL)
+
+        # Assertions
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    def test_is_cached_without_cache(self):
+        session_manager = SessionManager()
+
+        # Assertions
+        self.assertFalse(session_manager.is_cached(BASE_URL, {'page': 'athleteDetail', 'athleteId': '4292888'}))
+
+    def _cached_session_manager(self, cache_dir):
+        # Answer every request with a small page, or fail like an unreachable server once `down` is set
+        class FakeAdapter(HTTPAdapter):
+            down = False
+
+            def send(self, request, **kwargs):
+                if self.down:
+                    raise requests.ConnectionError('Server unreachable')
+                return self.build_response(request, HTTPResponse(body=io.BytesIO(b'<html><body>Hello, world!</body></html>'), status=200, preload_content=False))
+        session_manager = SessionManager(cache_name=os.path.join(cache_dir, 'cache'), expire_after=60)
+        adapter = FakeAdapter()
+        session_manager.get_session().mount('https://', adapter)
+        return session_manager, adapter
+
+    @unittest.skipIf(requests_cache is None, 'requests-cache is not installed')
+    def test_cache_expire_after(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            session_manager, _ = self._cached_session_manager(cache_dir)
+            session = session_manager.get_session()
+            result_params = {'page': 'resultDetail', 'id': '123'}
+            athlete_params = {'page': 'athleteDetail', 'athleteId': '4292888'}
+            session.get(BASE_URL, params=result_params)
+            session.get(BASE_URL, params=athlete_params)
+
+            # Result pages are kept for a day, other pages for expire_after
+            result_response = session.get(BASE_URL, params=result_params)
+            athlete_response = session.get(BASE_URL, params=athlete_params)
+            self.assertTrue(result_response.from_cache)
+            self.assertAlmostEqual((result_response.expires - result_response.created_at).total_seconds(), 86400, delta=5)
+            self.assertTrue(athlete_response.from_cache)
+            self.assertAlmostEqual((athlete_response.expires - athlete_response.created_at).total_seconds(), 60, delta=5)
+            self.assertTrue(session_manager.is_cached(BASE_URL, result_params))
+            self.assertTrue(session_manager.is_cached(BASE_URL, athlete_params))
+            session.close()
+
+    @unittest.skipIf(requests_cache is None, 'requests-cache is not installed')
+    def test_cache_stale_if_error(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            session_manager, adapter = self._cached_session_manager(cache_dir)
+            session = session_manager.get_session()
+            params = {'page': 'athleteDetail', 'athleteId': '4292888'}
+            response = session.get(BASE_URL, params=params)
+
+            # Expire the stored page and take the server down
+            session.cache.save_response(response, response.cache_key, expires=datetime.now(timezone.utc) - timedelta(seconds=1))
+            adapter.down = True
+            self.assertFalse(session_manager.is_cached(BASE_URL, params))
+            with self.assertLogs('requests_cache', level='WARNING'):
+                stale_response = session.get(BASE_URL, params=params)
+
+            # Assertions
+            self.assertTrue(stale_response.from_cache)
+            self.assertTrue(stale_response.is_expired)
+            self.assertEqual(stale_response.content, b'<html><body>Hello, world!</body></html>')
+            session.close()
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_acquire_within_capacity(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 0
+        session_manager = SessionManager(max_requests_per_timeframe=(2, 10))
+
+        # Two requests fit in the bucket without waiting
+        session_manager.acquire()
+        session_manager.acquire()
+
+        # Assertions
+        mock_sleep.assert_not_called()
+        self.assertEqual(session_manager.tokens, 0)
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_acquire_empty_bucket(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 0
+        session_manager = SessionManager(max_requests_per_timeframe=(2, 10))
+
+        # The third request has to wait for one token to be refilled
+        session_manager.acquire()
+        session_manager.acquire()
+        session_manager.acquire()
+
+        # Assertions
+        mock_sleep.assert_called_once_with(5)
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_acquire_refill(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 0
+        session_manager = SessionManager(max_requests_per_timeframe=(2, 10))
+
+        # Empty the bucket and wait long enough for it to refill completely
+        session_manager.acquire()
+        session_manager.acquire()
+        mock_monotonic.return_value = 100
+        session_manager.acquire()
+
+        # Assertions
+        mock_sleep.assert_not_called()
+        self.assertEqual(session_manager.tokens, 1)
+
 class TestSwimrankingsScraper(unittest.TestCase):
 
     def setUp(self):
@@ -53,10 +196,17 @@ class TestSwimrankingsScraper(unittest.TestCase):
         self.assertEqual(club_instance.club_id, club_id)
         self.assertEqual(club_instance.sessionManager, self.mock_session_manager)
 
+    def test_map(self):
+        athlete_ids = [123456, 234567, 345678]
+        athletes = self.scraper.map(self.scraper.get_athlete, athlete_ids)
+        # Ensure that the results are returned in the same order as the IDs
+        self.assertEqual([athlete.athlete_id for athlete in athletes], athlete_ids)
+
 class TestScraperMixin(unittest.TestCase):
     def setUp(self):
         # Create a mock SessionManager for testing
         self.mock_session_manager = MagicMock()
+        self.mock_session_manager.is_cached.return_value = False
 
         # Create an instance of ScraperMixin for testing
         self.scraper_mixin = ScraperMixin(self.mock_session_manager, update_interval=60)
@@ -67,9 +217,9 @@ class TestScraperMixin(unittest.TestCase):
         self.assertEqual(self.scraper_mixin.last_updated, None)
         self.assertEqual(self.scraper_mixin.page_content, None)
 
-    @patch('time.time')
+    @patch('time.monotonic')
     def test__update_page_content(self, mock_time):
-        # Mock the time.time method to return a fixed time
+        # Mock the time.monotonic method to return a fixed time
         fixed_time = time.mktime(time.strptime('2018-01-01 00:00:00', '%Y-%m-%d %H:%M:%S'))
         mock_time.return_value = fixed_time
 
@@ -87,11 +237,98 @@ class TestScraperMixin(unittest.TestCase):
         # Assertions
         self.assertEqual(self.scraper_mixin.page_content, BeautifulSoup(b'<html><body>Hello, world!</body></html>', 'lxml'))
         self.assertEqual(self.scraper_mixin.last_updated, fixed_time)
-        self.mock_session_manager.add_request.assert_called_once()
+        self.mock_session_manager.acquire.assert_called_once()
+
+    def test__update_page_content_empty_response(self):
+        # Mock the requests.get method to return an empty response
+        mock_response = MagicMock()
+        mock_response.content = b''
+        self.mock_session_manager.get_session.return_value.get.return_value = mock_response
+
+        # Call the _update_page_content method with mock parameters
+        self.scraper_mixin._update_page_content(params={'param1': 'value1', 'param2': 'value2'})
+
+        # Assertions
+        self.assertEqual(self.scraper_mixin.page_content, None)
+        self.assertEqual(self.scraper_mixin.last_updated, None)
+
+        # The empty response is not treated as fresh, so the next request fetches the page again
+        self.scraper_mixin._get_page_content(params={'param1': 'value1', 'param2': 'value2'})
+        self.assertEqual(self.mock_session_manager.get_session.return_value.get.call_count, 2)
+
+    def test__update_page_content_uppercase_body(self):
+        # Mock the requests.get method to return a page with uppercase tags
+        mock_response = MagicMock()
+        mock_response.content = b'<HTML><BODY>Hello, world!</BODY></HTML>'
+        self.mock_session_manager.get_session.return_value.get.return_value = mock_response
+
+        # Call the _update_page_content method with mock parameters
+        self.scraper_mixin._update_page_content(params={'param1': 'value1', 'param2': 'value2'})
+
+        # Assertions
+        self.assertEqual(self.scraper_mixin.page_content.body.get_text(), 'Hello, world!')
+
+    def test__update_page_content_without_body(self):
+        # Mock the requests.get method to return a valid page without a body tag
+        mock_response = MagicMock()
+        mock_response.content = b'<!DOCTYPE html><title>t</title><table><tr><td>Hello, world!</td></tr></table>'
+        self.mock_session_manager.get_session.return_value.get.return_value = mock_response
+
+        # Call the _update_page_content method with mock parameters
+        self.scraper_mixin._update_page_content(params={'param1': 'value1', 'param2': 'value2'})
+
+        # Assertions
+        self.assertEqual(self.scraper_mixin.page_content.find('td').get_text(), 'Hello, world!')
+
+    def test__update_page_content_strained(self):
+        # Mock a club ranking page with a layout table around the athlete list
+        mock_response = MagicMock()
+        mock_response.content = b'<html><body><table><tr><td><table class="athleteList"><tr><td>Athlete</td></tr></table></td></tr></table></body></html>'
+        self.mock_session_manager.get_session.return_value.get.return_value = mock_response
+
+        # Call the _update_page_content method with the parameters of a club ranking page
+        self.scraper_mixin._update_page_content(params={'page': 'rankingDetail', 'clubId': '123'})
+
+        # Assertions
+        self.assertEqual(str(self.scraper_mixin.page_content), '<table class="athleteList"><tr><td>Athlete</td></tr></table>')
+
+    def test__update_page_content_cached(self):
+        # Mock a response that is stored in the on-disk cache
+        self.mock_session_manager.is_cached.return_value = True
+        mock_response = MagicMock()
+        mock_response.content = b'<html><body>Hello, world!</body></html>'
+        self.mock_session_manager.get_session.return_value.get.return_value = mock_response
+
+        # Call the _update_page_content method with mock parameters
+        self.scraper_mixin._update_page_content(params={'param1': 'value1', 'param2': 'value2'})
+
+        # Assertions
+        self.mock_session_manager.acquire.assert_not_called()
+        self.mock_session_manager.get_session.return_value.get.assert_called_once()
+
+    def test__update_page_content_async(self):
+        # Mock the AsyncSessionManager and the response of the httpx client
+        mock_async_session_manager = MagicMock()
+        mock_async_session_manager.acquire = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.content = b'<html><body>Hello, world!</body></html>'
+        mock_async_session_manager.get_client.return_value.get = AsyncMock(return_value=mock_response)
+        self.scraper_mixin.sessionManager = mock_async_session_manager
+
+        # Call the _update_page_content_async method with mock parameters
+        page = asyncio.run(self.scraper_mixin._update_page_content_async(params={'param1': 'value1', 'param2': None}))
 
-    @patch('time.time')
+        # Assertions
+        self.assertEqual(page, BeautifulSoup(b'<html><body>Hello, world!</body></html>', 'lxml'))
+        # The page is returned to the caller and not stored on the instance
+        self.assertIsNone(self.scraper_mixin.page_content)
+        self.assertIsNone(self.scraper_mixin.last_updated)
+        mock_async_session_manager.acquire.assert_awaited_once()
+        mock_async_session_manager.get_client.return_value.get.assert_awaited_once_with(BASE_URL, params={'param1': 'value1'})
+
+    @patch('time.monotonic')
     def test__get_page_content_first_request(self, mock_time):
-        # Mock the time.time method to return a fixed time
+        # Mock the time.monotonic method to return a fixed time
         fixed_time = time.mktime(time.strptime('2018-01-01 00:00:00', '%Y-%m-%d %H:%M:%S'))
         mock_time.return_value = fixed_time
 
@@ -108,9 +345,9 @@ class TestScraperMixin(unittest.TestCase):
 
         self.scraper_mixin._update_page_content.assert_called_once_with(params)
     
-    @patch('time.time')
+    @patch('time.monotonic')
     def test__get_page_content_cash_hit(self, mock_time):
-        # Mock the time.time method to return a fixed time
+        # Mock the time.monotonic method to return a fixed time
         fixed_time = time.mktime(time.strptime('2018-01-01 00:00:00', '%Y-%m-%d %H:%M:%S'))
         mock_time.return_value = fixed_time
         
@@ -128,9 +365,9 @@ class TestScraperMixin(unittest.TestCase):
         self.assertEqual(result2, self.scraper_mixin.page_content)
         self.mock_session_manager.get_session.return_value.get.assert_called_once()
 
-    @patch('time.time')
+    @patch('time.monotonic')
     def test__get_page_content_cash_miss(self, mock_time):
-        # Mock the time.time method to return a fixed time
+        # Mock the time.monotonic method to return a fixed time
         fixed_time = time.mktime(time.strptime('2018-01-01 00:00:00', '%Y-%m-%d %H:%M:%S'))
         mock_time.return_value = fixed_time
         
@@ -148,9 +385,29 @@ class TestScraperMixin(unittest.TestCase):
         self.assertEqual(result2, self.scraper_mixin.page_content)
         self.assertEqual(self.mock_session_manager.get_session.return_value.get.call_count, 2)
 
-    @patch('time.time')
+    @patch('time.monotonic')
+    def test__get_page_content_alternating(self, mock_time):
+        # Mock the time.monotonic method to return a fixed time
+        fixed_time = time.mktime(time.strptime('2018-01-01 00:00:00', '%Y-%m-%d %H:%M:%S'))
+        mock_time.return_value = fixed_time
+
+        # Mock the requests.get method to return a mock response
+        mock_response = MagicMock()
+        mock_response.content = b'<html><body>Hello, world!</body></html>'
+        self.mock_session_manager.get_session.return_value.get.return_value = mock_response
+
+        # Call the _get_page_content method alternating between two pages, once with the ID as an integer
+        self.scraper_mixin._get_page_content({'page': 'athleteDetail', 'athleteId': '4292888'})
+        self.scraper_mixin._get_page_content({'page': 'meetDetail', 'meetId': '601234'})
+        self.scraper_mixin._get_page_content({'page': 'athleteDetail', 'athleteId': 4292888})
+
+        # Assertions
+        self.assertEqual(self.mock_session_manager.get_session.return_value.get.call_count, 2)
+        self.assertEqual(self.scraper_mixin.last_request, {'page': 'athleteDetail', 'athleteId': 4292888})
+
+    @patch('time.monotonic')
     def test__get_page_content_update_interval(self, mock_time):
-        # Mock the time.time method to return a fixed time
+        # Mock the time.monotonic method to return a fixed time
         fixed_time = time.mktime(time.strptime('2018-01-01 00:00:00', '%Y-%m-%d %H:%M:%S'))
         mock_time.return_value = fixed_time
 
@@ -171,6 +428,80 @@ class TestScraperMixin(unittest.TestCase):
         self.assertEqual(self.mock_session_manager.get_session.return_value.get.call_count, 2)
 
 
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncSessionManager(unittest.TestCase):
+    def setUp(self):
+        # Serve the saved pages through the httpx client of a real AsyncSessionManager
+        self.session_manager = AsyncSessionManager()
+        self.session_manager.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle_request))
+
+    def handle_request(self, request):
+        params = request.url.params
+        if params.get('athletePage') == 'MEET':
+            file_name = 'athlete_meets_page.html'
+        elif params.get('page') == 'athleteDetail':
+            file_name = 'athlete_detail_page.html'
+        else:
+            file_name = 'meet_races_page.html'
+        with open(os.path.join(os.path.dirname(values_for_testing.__file__), file_name), 'rb') as page:
+            return httpx.Response(200, content=page.read())
+
+    def test_list_async(self):
+        # Use an update interval of 0, so every page counts as stale as soon as it is fetched
+        athlete = Athlete(4787911, self.session_manager, update_interval=0)
+        meet = Meet(642564, self.session_manager, update_interval=0)
+
+        async def scrape():
+            try:
+                return await asyncio.gather(
+                    athlete.list_personal_bests_async(),
+                    athlete.list_meets_async(),
+                    meet.list_races_async(1, 1),
+                    meet.list_results_async(1, 1, 1),
+                )
+            finally:
+                await self.session_manager.aclose()
+        personal_bests, meets, races, results = asyncio.run(scrape())
+
+        # Assertions
+        self.assertEqual(personal_bests, values_for_testing.athlete_personal_best)
+        self.assertEqual(meets, values_for_testing.athlete_meets)
+        self.assertEqual(races, values_for_testing.meet_races)
+        self.assertEqual(results, values_for_testing.meet_results)
+
+    def test_list_async_overlapping(self):
+        requests_made = []
+
+        async def handle_request_slowly(request):
+            requests_made.append(request.url.params.get('athletePage'))
+            # Hold the personal bests page back until the meets page has been fetched
+            if request.url.params.get('athletePage') is None:
+                await asyncio.sleep(0.05)
+            return self.handle_request(request)
+        self.session_manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request_slowly))
+        athlete = Athlete(4787911, self.session_manager)
+
+        async def scrape():
+            try:
+                await asyncio.gather(athlete.list_personal_bests_async(), athlete.list_meets_async())
+                # Both pages are fresh, so these are served without new requests
+                return await athlete.list_meets_async(), await athlete.list_personal_bests_async()
+            finally:
+                await self.session_manager.aclose()
+        meets, personal_bests = asyncio.run(scrape())
+
+        # Assertions
+        self.assertEqual(meets, values_for_testing.athlete_meets)
+        self.assertEqual(personal_bests, values_for_testing.athlete_personal_best)
+        self.assertEqual(len(requests_made), 2)
+
+    def test_list_sync(self):
+        athlete = Athlete(4787911, self.session_manager)
+
+        # The synchronous methods need a SessionManager and must not silently return no data
+        with self.assertRaises(AttributeError):
+            athlete.list_personal_bests()
+
 class TestAthlete(unittest.TestCase):
 
     def setUp(self):
@@ -189,6 +520,30 @@ class TestAthlete(unittest.TestCase):
         self.athlete._get_page_content.assert_called_once_with({'page': 'athleteDetail', 'athleteId': self.athete_id, 'pbest': '-1'})
         self.assertEqual(self.personal_best, values_for_testing.athlete_personal_best)
 
+    def test_list_personal_bests_async(self):
+        # Mock the page content methods to avoid making actual requests
+        self.athlete._get_page_content_async = AsyncMock(return_value=values_for_testing.athlete_detail_page)
+        self.athlete._get_page_content = MagicMock()
+        # Call the list_personal_bests_async method
+        self.personal_best = asyncio.run(self.athlete.list_personal_bests_async())
+
+        # Assertions
+        self.athlete._get_page_content_async.assert_awaited_once_with({'page': 'athleteDetail', 'athleteId': self.athete_id, 'pbest': '-1'})
+        self.athlete._get_page_content.assert_not_called()
+        self.assertEqual(self.personal_best, values_for_testing.athlete_personal_best)
+
+    def test_iter_personal_bests(self):
+        # Mock the _get_page_content method to avoid making actual requests
+        self.athlete._get_page_content = MagicMock()
+        self.athlete._get_page_content.return_value = values_for_testing.athlete_detail_page
+        # Call the iter_personal_bests method
+        personal_bests = self.athlete.iter_personal_bests()
+
+        # Assertions
+        self.athlete._get_page_content.assert_not_called()
+        self.assertEqual(next(personal_bests), values_for_testing.athlete_personal_best[0])
+        self.athlete._get_page_content.assert_called_once_with({'page': 'athleteDetail', 'athleteId': self.athete_id, 'pbest': '-1'})
+
     def test_list_personal_bests_failure(self):
         # Mock the _get_page_content method to avoid making actual requests
         self.athlete._get_page_content = MagicMock()
@@ -332,6 +687,21 @@ class TestMeet(unittest.TestCase):
         self.meet._get_page_content.assert_called_once_with({'page': 'meetDetail', 'meetId': self.meet_id, 'gender': self.gender, 'styleId':self.event_splits_id})
         self.assertEqual(self.results, values_for_testing.meet_results_splits)
 
+    def test_list_results_after_list_races(self):
+        # Mock the _get_page_content method to avoid making actual requests
+        self.meet._get_page_content = MagicMock()
+        self.meet._get_page_content.return_value = values_for_testing.meet_races_page
+        # Call the list_races method followed by the list_results method
+        self.races = self.meet.list_races(self.event_id, self.gender)
+        tables = self.meet._tables_cache[(self.event_id, self.gender)][1]
+        self.results = self.meet.list_results(self.event_id, self.gender, self.race_id)
+
+        # Assertions
+        self.assertEqual(self.meet._get_page_content.call_count, 2)
+        self.assertIs(self.meet._tables_cache[(self.event_id, self.gender)][1], tables)
+        self.assertEqual(self.races, values_for_testing.meet_races)
+        self.assertEqual(self.results, values_for_testing.meet_results)
+
     def test_list_results_failure(self):
         # Mock the _get_page_content method to avoid making actual requests
         self.meet._get_page_content = MagicMock()
@@ -427,6 +797,18 @@ class TestMeets(unittest.TestCase):
         self.meets._get_page_content.assert_called_once_with({'page': 'meetSelect', 'nationId': self.nation_id, 'selectPage': self.time_period})
         self.assertEqual(self.time_periods, values_for_testing.meets_list)
 
+    def test_iter_meets(self):
+        # Mock the _get_page_content method to avoid making actual requests
+        self.meets._get_page_content = MagicMock()
+        self.meets._get_page_content.return_value = values_for_testing.meets_page
+        # Call the iter_meets method
+        meets = self.meets.iter_meets(self.nation_id, self.time_period)
+
+        # Assertions
+        self.meets._get_page_content.assert_not_called()
+        self.assertEqual(next(meets), values_for_testing.meets_list[0])
+        self.meets._get_page_content.assert_called_once_with({'page': 'meetSelect', 'nationId': self.nation_id, 'selectPage': self.time_period})
+
     def test_list_meets_failure(self):
         # Mock the _get_page_content method to avoid making actual requests
         self.meets._get_page_content = MagicMock()
@@ -455,6 +837,15 @@ class TestClub(unittest.TestCase):
         self.club._get_page_content.assert_called_once_with({'page': 'rankingDetail', 'clubId': self.club_id, 'stroke': '9', 'athleteGender': self.athlete_gender_parameter})
         self.assertEqual(self.athletes, values_for_testing.club_athletes)
 
+    def test_list_athletes_women(self):
+        # Mock the _get_page_content method to avoid making actual requests
+        self.club._get_page_content = MagicMock()
+        self.club._get_page_content.return_value = None
+        # Call the list_athletes method
+        self.athletes = self.club.list_athletes(2)
+        # Assertions
+        self.club._get_page_content.assert_called_once_with({'page': 'rankingDetail', 'clubId': self.club_id, 'stroke': '9', 'athleteGender': 'ALL_WOMEN'})
+
     def test_list_athletes_failure(self):
             # Mock the _get_page_content method to avoid making actual requests
         self.club._get_page_content = MagicMock()